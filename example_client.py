@@ -4,9 +4,47 @@ Example client for the Senechal MCP server.
 This demonstrates basic usage of the MCP client to interact with the server.
 """
 import asyncio
-import json
+import sys
+from functools import singledispatch
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import CallToolResult, ReadResourceResult
+
+def print_json(data):
+    """Pretty-print data as JSON, writing orjson's bytes straight to stdout."""
+    # Flush pending print() output first so the two layers stay in order
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
+
+@singledispatch
+def render(result):
+    """Print a result that has no dedicated handler."""
+    print(f"Result (type {type(result).__name__}):", result)
+
+@render.register
+def _(result: dict):
+    print_json(result)
+
+@render.register
+def _(result: str):
+    # Pretty-print JSON text, otherwise print it as-is (e.g. markdown)
+    try:
+        data = orjson.loads(result)
+    except orjson.JSONDecodeError:
+        print(result)
+        return
+    print_json(data)
+
+@render.register
+def _(result: ReadResourceResult):
+    for item in result.contents:
+        render(item.text if hasattr(item, 'text') else item)
+
+@render.register
+def _(result: CallToolResult):
+    for item in result.content:
+        render(item.text if hasattr(item, 'text') else item)
 
 async def main():
     # Create parameters for connecting to the server
@@ -24,9 +62,18 @@ async def main():
             print("Initializing connection to Senechal MCP server...")
             await session.initialize()
             
+            # The listing calls are independent, so issue them together
+            resources, tools, prompts = await asyncio.gather(
+                session.list_resources(),
+                session.list_tools(),
+                session.list_prompts(),
+                return_exceptions=True
+            )
+            
             # List available resources
             print("\nAvailable Resources:")
-            resources = await session.list_resources()
+            if isinstance(resources, BaseException):
+                raise resources
             # Check if resources is a list/tuple or has a different structure
             if hasattr(resources, 'resources'):
                 # API returned an object with a resources property
@@ -50,7 +97,8 @@ async def main():
             
             # List available tools
             print("\nAvailable Tools:")
-            tools = await session.list_tools()
+            if isinstance(tools, BaseException):
+                raise tools
             # Adapt for possible different return formats
             if hasattr(tools, 'tools'):
                 for tool in tools.tools:
@@ -70,7 +118,8 @@ async def main():
             # List available prompts
             print("\nAvailable Prompts:")
             try:
-                prompts = await session.list_prompts()
+                if isinstance(prompts, BaseException):
+                    raise prompts
                 # Adapt for possible different return formats
                 if hasattr(prompts, 'prompts'):
                     for prompt in prompts.prompts:
@@ -89,62 +138,23 @@ async def main():
             except Exception as e:
                 print(f"Error listing prompts: {e}")
             
+            # Read a resource, call a tool and get a prompt concurrently
+            resource_result, tool_result, prompt_result = await asyncio.gather(
+                session.read_resource("senechal://health/summary/day?span=2&metrics=all"),
+                session.call_tool("fetch_health_profile", arguments={}),
+                session.get_prompt("analyze_health_summary"),
+                return_exceptions=True
+            )
+            
             # Read a resource
             try:
                 print("\nFetching health summary for day:")
-                result = await session.read_resource("senechal://health/summary/day?span=2&metrics=all")
+                if isinstance(resource_result, BaseException):
+                    raise resource_result
+                result = resource_result
                 print("Resource result type:", type(result).__name__)
                 
-                # Handle different response formats
-                if isinstance(result, dict):
-                    # Direct dictionary response
-                    print(json.dumps(result, indent=2))
-                elif isinstance(result, str):
-                    # String response, try to parse as JSON if it looks like JSON
-                    if result.strip().startswith('{') or result.strip().startswith('['):
-                        try:
-                            data = json.loads(result)
-                            print(json.dumps(data, indent=2))
-                        except json.JSONDecodeError:
-                            print(result)
-                    else:
-                        print(result)
-                elif hasattr(result, 'resource_contents'):
-                    # Handle resource_contents attribute
-                    print("Resource contents:", result.resource_contents)
-                    print(json.dumps(result.resource_contents, indent=2))
-                elif hasattr(result, 'contents'):
-                    # Handle contents attribute
-                    if isinstance(result.contents, list) and len(result.contents) > 0:
-                        for content_item in result.contents:
-                            if hasattr(content_item, 'text'):
-                                try:
-                                    # Try to parse as JSON
-                                    json_data = json.loads(content_item.text)
-                                    print(json.dumps(json_data, indent=2))
-                                except json.JSONDecodeError:
-                                    print(f"Content text: {content_item.text}")
-                            else:
-                                print(f"Content item: {content_item}")
-                    else:
-                        print(f"Contents: {result.contents}")
-                        
-                # Special handling for ReadResourceResult type
-                if hasattr(result, '__class__') and result.__class__.__name__ == 'ReadResourceResult':
-                    if hasattr(result, 'contents'):
-                        content_items = result.contents
-                        if isinstance(content_items, list) and len(content_items) > 0:
-                            for item in content_items:
-                                if hasattr(item, 'text'):
-                                    try:
-                                        json_data = json.loads(item.text)
-                                        print("Parsed ReadResourceResult contents:")
-                                        print(json.dumps(json_data, indent=2))
-                                    except (json.JSONDecodeError, TypeError):
-                                        pass
-                else:
-                    # Fall back to string representation
-                    print(result)
+                render(result)
                     
             except Exception as e:
                 print(f"Error reading resource: {e}")
@@ -154,41 +164,12 @@ async def main():
             # Call a tool
             try:
                 print("\nCalling fetch_health_profile tool:")
-                result = await session.call_tool("fetch_health_profile", arguments={})
+                if isinstance(tool_result, BaseException):
+                    raise tool_result
+                result = tool_result
                 print("Tool result type:", type(result).__name__)
                 
-                # Extract the result data based on the structure
-                if hasattr(result, 'result'):
-                    print("Result has 'result' attribute")
-                    result_data = result.result
-                elif hasattr(result, 'return_value'):
-                    print("Result has 'return_value' attribute")
-                    result_data = result.return_value
-                else:
-                    print("Using result directly")
-                    result_data = result
-                
-                if isinstance(result_data, dict):
-                    print(json.dumps(result_data, indent=2))
-                elif isinstance(result_data, str):
-                    try:
-                        json_data = json.loads(result_data)
-                        print(json.dumps(json_data, indent=2))
-                    except json.JSONDecodeError:
-                        print(result_data)
-                elif hasattr(result_data, 'content') and isinstance(result_data.content, list):
-                    # Extract content from result_data.content list
-                    for content_item in result_data.content:
-                        if hasattr(content_item, 'text'):
-                            try:
-                                json_data = json.loads(content_item.text)
-                                print(json.dumps(json_data, indent=2))
-                            except json.JSONDecodeError:
-                                print(content_item.text)
-                        else:
-                            print(content_item)
-                else:
-                    print(f"Result data (type {type(result_data).__name__}):", result_data)
+                render(result)
             except Exception as e:
                 print(f"Error calling tool: {e}")
                 import traceback
@@ -197,7 +178,8 @@ async def main():
             # Get a prompt
             try:
                 print("\nGetting analyze_health_summary prompt:")
-                prompt_result = await session.get_prompt("analyze_health_summary")
+                if isinstance(prompt_result, BaseException):
+                    raise prompt_result
                 print("Prompt:")
                 for message in prompt_result.messages:
                     print(f"[{message.role}]: {message.content.text}")
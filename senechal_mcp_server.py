@@ -1,54 +1,122 @@
 #!/usr/bin/env python3
 from mcp.server.fastmcp import FastMCP, Context
+import asyncio
 import httpx
+import orjson
 import os
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import atexit
+import copy
+import math
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
 from dotenv import load_dotenv
 from typing import Optional, Dict, Any, List
-import json
+from contextlib import asynccontextmanager
+from urllib.parse import parse_qsl
 from dataclasses import dataclass
 
+# Load environment variables
+load_dotenv()
+
 # Set up logging
 log_dir = os.path.dirname(os.path.abspath(__file__))
 log_file = os.path.join(log_dir, "senechal_mcp_server.log")
-logging.basicConfig(
-    filename=log_file,
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+
+class JsonFormatter(logging.Formatter):
+    """Format records as JSON lines with epoch timestamps, skipping strftime."""
+    
+    def format(self, record):
+        entry = {"ts": record.created, "lvl": record.levelname, "msg": record.getMessage()}
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+# Records are queued on the calling thread and written to disk by a background
+# listener, so request handlers never block on file I/O
+log_queue = queue.SimpleQueue()
+file_handler = logging.FileHandler(log_file)
+if os.getenv("SENECHAL_LOG_FORMAT", "").lower() == "json":
+    file_handler.setFormatter(JsonFormatter())
+else:
+    file_handler.setFormatter(logging.Formatter(
+        fmt='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue records for an in-process listener, leaving formatting to the file handler."""
+    
+    def prepare(self, record):
+        # The queue never leaves this process, so exc_info can travel as-is;
+        # only merge args into msg so the record doesn't hold caller objects
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+logging.basicConfig(level=logging.INFO, handlers=[LocalQueueHandler(log_queue)])
 logger = logging.getLogger("senechal_mcp")
 
 # Create stats tracking
 class ServerStats:
+    __slots__ = ("api_calls", "resource_requests", "tool_calls", "errors",
+                 "_start_time", "_last_status", "_last_logged_call")
+    
+    # Minimum number of seconds between status log lines
+    STATUS_INTERVAL = 5.0
+    # Number of API calls between status log lines
+    STATUS_LOG_EVERY = 100
+    STATUS_FORMAT = ("SERVER STATUS: Uptime: %dh %dm %ds, API Calls: %s, "
+                     "Resource Requests: %s, Tool Calls: %s, Errors: %s")
+    
     def __init__(self):
         self.api_calls = 0
         self.resource_requests = 0
         self.tool_calls = 0
         self.errors = 0
-        self.start_time = datetime.now()
+        self._start_time = time.monotonic()
+        self._last_status = 0.0
+        self._last_logged_call = 0
+    
+    def maybe_log_status(self):
+        """Log status once enough API calls have been made since the last status line."""
+        if self.api_calls - self._last_logged_call >= self.STATUS_LOG_EVERY:
+            self.log_status()
     
     def log_status(self):
-        uptime = datetime.now() - self.start_time
-        hours, remainder = divmod(uptime.total_seconds(), 3600)
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        now = time.monotonic()
+        if now - self._last_status < self.STATUS_INTERVAL:
+            return
+        self._last_status = now
+        self._last_logged_call = self.api_calls
+        
+        hours, remainder = divmod(now - self._start_time, 3600)
         minutes, seconds = divmod(remainder, 60)
-        uptime_str = f"{int(hours)}h {int(minutes)}m {int(seconds)}s"
         
-        logger.info(f"SERVER STATUS: Uptime: {uptime_str}, API Calls: {self.api_calls}, "
-                   f"Resource Requests: {self.resource_requests}, Tool Calls: {self.tool_calls}, "
-                   f"Errors: {self.errors}")
+        logger.info(self.STATUS_FORMAT, hours, minutes, seconds, self.api_calls,
+                    self.resource_requests, self.tool_calls, self.errors)
 
 # Initialize stats
 stats = ServerStats()
 
-# Load environment variables
-load_dotenv()
+# Largest number of periods a summary request may cover (the API's own limit)
+MAX_SUMMARY_SPAN = 52
 
-logger.info("Starting Senechal Health MCP Server")
+# Query parameters passed through to the health summary endpoint
+SUMMARY_PARAMS = frozenset({"metrics", "span", "offset"})
 
-# Create an MCP server
-mcp = FastMCP("Senechal Health MCP")
+# Supported summary periods and their API endpoints
+SUMMARY_ENDPOINTS = {p: f"health/summary/{p}" for p in ("day", "week", "month", "year")}
+
+logger.info("Starting Senechal Health MCP Server")
 
 # Constants
 API_BASE_URL = os.getenv("SENECHAL_API_BASE_URL")
@@ -62,124 +130,435 @@ if not API_KEY:
     logger.error("No API key found. Please set SENECHAL_API_KEY environment variable in .env file")
     raise ValueError("SENECHAL_API_KEY environment variable is required")
 
-logger.info(f"Using API URL: {API_BASE_URL}")
-logger.info(f"API Key: {'*' * len(API_KEY)}")
+logger.info("Using API URL: %s", API_BASE_URL)
+logger.info("API Key: %s", '*' * len(API_KEY))
+
+# Upper bound on concurrent upstream requests; matches the client's keep-alive pool
+MAX_CONCURRENT_REQUESTS = int(os.getenv("SENECHAL_MAX_CONCURRENCY", "20"))
+# Smoothed upstream latency (seconds) above which concurrency is backed off
+TARGET_LATENCY = float(os.getenv("SENECHAL_TARGET_LATENCY", "5.0"))
+
+class ConcurrencyLimiter:
+    """Async context manager capping in-flight requests; the limit can change at runtime."""
+    
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.active = 0
+        self._waiters: deque = deque()
+    
+    def set_limit(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        self._wake()
+    
+    def _wake(self) -> None:
+        # Hand free slots to waiters in arrival order; cancelled waiters are skipped
+        while self._waiters and self.active < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+    
+    async def __aenter__(self):
+        # Queue behind existing waiters so newcomers can't take their slots
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot was already handed to us; pass it on before giving up
+            if waiter.done() and not waiter.cancelled():
+                await self.__aexit__(None, None, None)
+            raise
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.active -= 1
+        self._wake()
+
+_api_limiter = ConcurrencyLimiter(MAX_CONCURRENT_REQUESTS)
+
+def set_max_concurrency(n: int) -> None:
+    """Change how many upstream requests may be in flight at once."""
+    _backpressure.set_ceiling(n)
+    logger.info("API concurrency limit set to %s", _api_limiter.limit)
+
+class BackpressureController:
+    """
+    Tune the concurrency limit with additive increase / multiplicative decrease.
+    
+    The limit grows by alpha while the smoothed latency stays within
+    target_latency, and is multiplied by beta when latency degrades or the
+    API reports errors or throttling. Decreases are applied at most once per
+    cooldown so a burst of slow responses only backs off once.
+    """
+    
+    def __init__(self, limiter: ConcurrencyLimiter, c_min: int = 1, c_max: int = MAX_CONCURRENT_REQUESTS,
+                 alpha: float = 0.5, beta: float = 0.5, target_latency: float = TARGET_LATENCY,
+                 smoothing: float = 0.2, cooldown: float = 5.0):
+        self.limiter = limiter
+        self.c = float(limiter.limit)
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+        self.smoothing = smoothing
+        self.cooldown = cooldown
+        self.latency: Optional[float] = None
+        self._last_decrease = float("-inf")
+    
+    def set_ceiling(self, limit: int) -> None:
+        """Make limit both the current and the maximum concurrency."""
+        self.c_max = max(self.c_min, limit)
+        self.c = float(self.c_max)
+        self._apply()
+    
+    def record_success(self, elapsed: float) -> None:
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += self.smoothing * (elapsed - self.latency)
+        if self.latency <= self.target_latency:
+            self.c = min(self.c_max, self.c + self.alpha)
+            self._apply()
+        else:
+            self._decrease()
+    
+    def record_failure(self) -> None:
+        self._decrease()
+    
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.c = max(self.c_min, self.c * self.beta)
+        self._apply()
+    
+    def _apply(self) -> None:
+        limit = math.floor(self.c)
+        if limit != self.limiter.limit:
+            self.limiter.set_limit(limit)
+            logger.debug("API concurrency limit adjusted to %s", self.limiter.limit)
+
+_backpressure = BackpressureController(_api_limiter)
+
+# Statuses that are retried once after honouring Retry-After
+RETRY_STATUSES = frozenset({429, 503})
+# Longest Retry-After delay we are willing to wait before retrying
+MAX_RETRY_AFTER = 30.0
+
+def retry_after_seconds(response: httpx.Response) -> float:
+    """Read the Retry-After header as seconds, defaulting to one second."""
+    value = response.headers.get("retry-after")
+    if value is None:
+        return 1.0
+    try:
+        delay = float(value)
+    except ValueError:
+        # Retry-After may also be an HTTP date
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            delay = 1.0
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+# Shared HTTP client, created on first use and closed when the server shuts down
+_client: Optional[httpx.AsyncClient] = None
+
+# Accept override for the endpoints that return markdown rather than JSON
+MARKDOWN_HEADERS = {"Accept": "text/markdown, text/plain;q=0.9, */*;q=0.1"}
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared API client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            headers={"X-API-Key": API_KEY, "Accept": "application/json"},
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                max_connections=max(50, MAX_CONCURRENT_REQUESTS),
+                keepalive_expiry=30.0
+            ),
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+        )
+    return _client
+
+async def close_client() -> None:
+    """Close the shared API client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("API client closed")
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP):
+    """Release the shared API client when the server stops."""
+    try:
+        yield {}
+    finally:
+        await close_client()
+
+# Create an MCP server
+mcp = FastMCP("Senechal Health MCP", lifespan=server_lifespan)
 
 # Helper class for response types
-@dataclass
+@dataclass(slots=True)
 class HealthSummary:
     period_type: str
     summaries: List[Dict[str, Any]]
     generated_at: str
 
-@dataclass
+@dataclass(slots=True)
 class HealthProfile:
     markdown: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     markdown: str
 
 # Helper functions
-async def make_api_request(endpoint: str, params: Optional[Dict[str, Any]] = None, expect_json: bool = True) -> Any:
-    """Make a request to the Senechal API with the API key."""
-    headers = {"X-API-Key": API_KEY}
-    
+# Completed responses are kept for a while so repeated reads of the same resource
+# don't hit the API again; concurrent identical requests share one fetch.
+RESPONSE_CACHE_TTL = 30.0
+RESPONSE_CACHE_SIZE = 128
+# Seconds to keep responses per endpoint; slowly changing data is kept longer
+CACHE_TTL_BY_ENDPOINT = {
+    "health/profile": 300.0,
+    "health/availablemetrics": 300.0,
+    **{endpoint: 60.0 for endpoint in SUMMARY_ENDPOINTS.values()},
+}
+_response_cache: Dict[tuple, tuple] = {}
+_inflight: Dict[tuple, asyncio.Task] = {}
+# Last successful response per request, kept past its TTL and served when the
+# API is unavailable
+STALE_CACHE_SIZE = 128
+_stale_cache: Dict[tuple, tuple] = {}
+
+def _request_key(endpoint: str, params: Optional[Dict[str, Any]], expect_json: bool) -> tuple:
+    """Build a hashable cache key for an API request."""
+    return (endpoint, expect_json, tuple(sorted((params or {}).items())))
+
+async def _fetch_from_api(key: tuple, endpoint: str, params: Optional[Dict[str, Any]], expect_json: bool) -> Any:
+    """Perform the upstream request and cache a successful response."""
     # Log the request
     stats.api_calls += 1
-    logger.info(f"API Request: {endpoint} - Params: {params}")
-    stats.log_status()
+    logger.info("API Request: %s - Params: %s", endpoint, params)
+    stats.maybe_log_status()
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{API_BASE_URL}/{endpoint}", headers=headers, params=params)
-            response.raise_for_status()
-            logger.info(f"API Request successful: {endpoint}")
-            if expect_json:
-                return response.json()
+        for attempt in range(2):
+            try:
+                async with _api_limiter:
+                    # Time only the request itself, not the wait for a slot
+                    started = time.monotonic()
+                    response = await get_client().get(
+                        endpoint, params=params, headers=None if expect_json else MARKDOWN_HEADERS
+                    )
+            except httpx.PoolTimeout:
+                # Waiting for a local pool connection says nothing about the upstream
+                raise
+            except httpx.TransportError:
+                _backpressure.record_failure()
+                raise
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                _backpressure.record_failure()
+                if attempt == 0 and response.status_code in RETRY_STATUSES:
+                    delay = retry_after_seconds(response)
+                    logger.warning("API Request throttled: %s - Status: %s, retrying in %.1fs",
+                                   endpoint, response.status_code, delay)
+                    await asyncio.sleep(delay)
+                    continue
             else:
-                return response.text
+                _backpressure.record_success(time.monotonic() - started)
+            break
+        response.raise_for_status()
+        logger.info("API Request successful: %s", endpoint)
+        if expect_json:
+            data = orjson.loads(response.content)
+        else:
+            data = response.text
     except Exception as e:
         stats.errors += 1
-        logger.error(f"API Request failed: {endpoint} - Error: {str(e)}")
+        logger.error("API Request failed: %s - Error: %s", endpoint, e)
         raise
+    
+    _response_cache.pop(key, None)
+    _response_cache[key] = (time.monotonic(), data)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        # Evict the least recently used entry
+        del _response_cache[next(iter(_response_cache))]
+    
+    _stale_cache.pop(key, None)
+    _stale_cache[key] = (time.time(), data)
+    if len(_stale_cache) > STALE_CACHE_SIZE:
+        del _stale_cache[next(iter(_stale_cache))]
+    return data
+
+def _finish_inflight(key: tuple, task: asyncio.Task) -> None:
+    """Drop a completed fetch from the in-flight map."""
+    _inflight.pop(key, None)
+    if not task.cancelled():
+        # Mark the exception as retrieved; callers that are still waiting re-raise it
+        task.exception()
+
+async def make_api_request(endpoint: str, params: Optional[Dict[str, Any]] = None, expect_json: bool = True,
+                           allow_stale: bool = True) -> Any:
+    """
+    Make a request to the Senechal API using the shared client.
+    
+    If the request fails and allow_stale is set, the last successful response
+    for the same request is returned instead. JSON objects are tagged with
+    "_stale" and "_cached_at", and markdown is prefixed with a notice line,
+    so callers can tell.
+    """
+    key = _request_key(endpoint, params, expect_json)
+    
+    cached = _response_cache.get(key)
+    ttl = CACHE_TTL_BY_ENDPOINT.get(endpoint, RESPONSE_CACHE_TTL)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        logger.info("API Cache hit: %s - Params: %s", endpoint, params)
+        # Move the entry to the end so eviction drops the least recently used
+        del _response_cache[key]
+        _response_cache[key] = cached
+        return cached[1]
+    
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_from_api(key, endpoint, params, expect_json))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _finish_inflight(key, t))
+    else:
+        logger.info("API Request joined in-flight fetch: %s - Params: %s", endpoint, params)
+    
+    try:
+        # Shield the shared fetch so one cancelled caller doesn't cancel it for the others
+        return await asyncio.shield(task)
+    except Exception:
+        stale = _stale_cache.get(key) if allow_stale else None
+        if stale is None:
+            raise
+        cached_at, data = stale
+        logger.warning("Serving stale response for %s cached at %s", endpoint, cached_at)
+        if isinstance(data, dict):
+            return {**data, "_stale": True, "_cached_at": cached_at}
+        if isinstance(data, str):
+            cached_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(cached_at))
+            return (f"> Stale data cached at {cached_time}; "
+                    f"the Senechal API is currently unavailable.\n\n{data}")
+        return data
+
+# Fallback content returned when the API cannot be reached
+METRICS_FALLBACK = "# Error\n\nUnable to retrieve available health metrics. Please check your API key and connection."
+PROFILE_FALLBACK = "# Error\n\nUnable to retrieve health profile data. Please check your API key and connection."
+SUMMARY_FALLBACK_MESSAGE = "Unable to retrieve health summary data for period '{period}'. Please check your API key and connection."
+
+def summary_error(period: str, error: Exception) -> Dict[str, str]:
+    """Build the fallback returned when a health summary request fails."""
+    return {
+        "error": f"API request failed: {error}",
+        "message": SUMMARY_FALLBACK_MESSAGE.format(period=period)
+    }
+
+def invalid_period_error(period: str) -> Dict[str, str]:
+    """Build the error returned for an unsupported summary period."""
+    logger.warning("Rejected unsupported summary period: %s", period)
+    return {
+        "error": f"Invalid period: {period}",
+        "message": f"period must be one of: {', '.join(SUMMARY_ENDPOINTS)}."
+    }
+
+def invalid_span_error(span: Any) -> Optional[Dict[str, str]]:
+    """Build the error for a span the API would reject, or return None if it is valid."""
+    try:
+        if 1 <= int(span) <= MAX_SUMMARY_SPAN:
+            return None
+    except (TypeError, ValueError):
+        pass
+    logger.warning("Rejected summary span: %s", span)
+    return {
+        "error": f"Invalid span: {span}",
+        "message": f"span must be between 1 and {MAX_SUMMARY_SPAN}."
+    }
 
 # Resources
 @mcp.resource(uri="senechal://health/availablemetrics")
-def get_available_metrics():
+async def get_available_metrics():
     """Get a list of available health metrics in markdown format."""
-    async def impl(resource_uri, query_params):
-        stats.resource_requests += 1
-        logger.info(f"Resource Request: health/availablemetrics - Params: {query_params}")
-        
-        try:
-            # Call the actual API, expecting markdown text instead of JSON
-            data = await make_api_request("health/availablemetrics", expect_json=False)
-            # Return as a Metrics object with markdown field
-            return Metrics(markdown=data)
-        except Exception as e:
-            logger.error(f"API error in health/availablemetrics: {str(e)}")
-            # Provide fallback data in case API fails
-            return Metrics(markdown="# Error\n\nUnable to retrieve available health metrics. Please check your API key and connection.")
+    stats.resource_requests += 1
+    logger.info("Resource Request: health/availablemetrics")
     
-    return impl
+    try:
+        # Call the actual API, expecting markdown text instead of JSON
+        data = await make_api_request("health/availablemetrics", expect_json=False)
+        # Return as a Metrics object with markdown field
+        return Metrics(markdown=data)
+    except Exception as e:
+        logger.error("API error in health/availablemetrics: %s", e)
+        # Provide fallback data in case API fails
+        return Metrics(markdown=METRICS_FALLBACK)
 
 
 
 @mcp.resource(uri="senechal://health/summary/{period}")
-def get_health_summary(period: str):
+async def get_health_summary(period: str):
     """
     Get a health summary for a specific period (day, week, month, year).
     
     Example: senechal://health/summary/day?metrics=all&span=7
     """
-    async def impl(resource_uri, query_params):
-        # Record stats
-        stats.resource_requests += 1
-        logger.info(f"Resource Request: health/summary/{period} - Params: {query_params}")
-        
-        # Convert query parameters for the API
-        request_params = {}
-        if 'metrics' in query_params:
-            request_params['metrics'] = query_params['metrics']
-        if 'span' in query_params:
-            request_params['span'] = query_params['span']
-        if 'offset' in query_params:
-            request_params['offset'] = query_params['offset']
-        
-        # Call the actual API
-        try:
-            data = await make_api_request(f"health/summary/{period}", request_params)
-            return data
-        except Exception as e:
-            logger.error(f"API error in health/summary/{period}: {str(e)}")
-            # Provide fallback data in case API fails
-            return {
-                "error": f"API request failed: {str(e)}",
-                "message": f"Unable to retrieve health summary data for period '{period}'. Please check your API key and connection."
-            }
-    
-    return impl
+    # The URI template match leaves any query string attached to the period
+    period, _, query = period.partition("?")
+    query_params = dict(parse_qsl(query))
+    
+    # Record stats
+    stats.resource_requests += 1
+    logger.info("Resource Request: health/summary/%s - Params: %s", period, query_params)
+    
+    endpoint = SUMMARY_ENDPOINTS.get(period)
+    if endpoint is None:
+        return invalid_period_error(period)
+    
+    # The API rejects out-of-range spans too; checking here saves the round trip
+    if "span" in query_params:
+        error = invalid_span_error(query_params["span"])
+        if error is not None:
+            return error
+    
+    # Convert query parameters for the API
+    request_params = {k: v for k, v in query_params.items() if k in SUMMARY_PARAMS}
+    
+    # Call the actual API
+    try:
+        data = await make_api_request(endpoint, request_params)
+        return data
+    except Exception as e:
+        logger.error("API error in health/summary/%s: %s", period, e)
+        # Provide fallback data in case API fails
+        return summary_error(period, e)
 
 @mcp.resource(uri="senechal://health/profile")
-def get_health_profile():
+async def get_health_profile():
     """Get the user's health profile in markdown format."""
-    async def impl(resource_uri, query_params):
-        stats.resource_requests += 1
-        logger.info(f"Resource Request: health/profile - Params: {query_params}")
-        
-        try:
-            # Call the actual API, expecting markdown text instead of JSON
-            data = await make_api_request("health/profile", expect_json=False)
-            # Return as a HealthProfile object with markdown field
-            return HealthProfile(markdown=data)
-        except Exception as e:
-            logger.error(f"API error in health/profile: {str(e)}")
-            # Provide fallback data in case API fails
-            return HealthProfile(markdown="# Error\n\nUnable to retrieve health profile data. Please check your API key and connection.")
+    stats.resource_requests += 1
+    logger.info("Resource Request: health/profile")
     
-    return impl
+    try:
+        # Call the actual API, expecting markdown text instead of JSON
+        data = await make_api_request("health/profile", expect_json=False)
+        # Return as a HealthProfile object with markdown field
+        return HealthProfile(markdown=data)
+    except Exception as e:
+        logger.error("API error in health/profile: %s", e)
+        # Provide fallback data in case API fails
+        return HealthProfile(markdown=PROFILE_FALLBACK)
 
 
 # Tools
@@ -199,9 +578,9 @@ async def fetch_available_metrics() -> str:
         data = await make_api_request("health/availablemetrics", expect_json=False)
         return data
     except Exception as e:
-        logger.error(f"API error in fetch_available_metrics: {str(e)}")
+        logger.error("API error in fetch_available_metrics: %s", e)
         # Provide fallback data in case API fails
-        return "# Error\n\nUnable to retrieve available health metrics. Please check your API key and connection."
+        return METRICS_FALLBACK
 
 
 
@@ -220,7 +599,16 @@ async def fetch_health_summary(period: str, metrics: str = "all", span: int = 1,
         A dictionary containing the health summary data
     """
     stats.tool_calls += 1
-    logger.info(f"Tool Call: fetch_health_summary - Args: period={period}, metrics={metrics}, span={span}, offset={offset}")
+    logger.info("Tool Call: fetch_health_summary - Args: period=%s, metrics=%s, span=%s, offset=%s", period, metrics, span, offset)
+    
+    endpoint = SUMMARY_ENDPOINTS.get(period)
+    if endpoint is None:
+        return invalid_period_error(period)
+    
+    # The API rejects out-of-range spans too; checking here saves the round trip
+    error = invalid_span_error(span)
+    if error is not None:
+        return error
     
     # Parameters for the API request
     params = {
@@ -231,15 +619,12 @@ async def fetch_health_summary(period: str, metrics: str = "all", span: int = 1,
     
     try:
         # Call the actual API
-        data = await make_api_request(f"health/summary/{period}", params)
+        data = await make_api_request(endpoint, params)
         return data
     except Exception as e:
-        logger.error(f"API error in fetch_health_summary: {str(e)}")
+        logger.error("API error in fetch_health_summary: %s", e)
         # Provide fallback data in case API fails
-        return {
-            "error": f"API request failed: {str(e)}",
-            "message": f"Unable to retrieve health summary data for period '{period}'. Please check your API key and connection."
-        }
+        return summary_error(period, e)
 
 @mcp.tool()
 async def fetch_health_profile() -> str:
@@ -257,19 +642,13 @@ async def fetch_health_profile() -> str:
         data = await make_api_request("health/profile", expect_json=False)
         return data
     except Exception as e:
-        logger.error(f"API error in fetch_health_profile: {str(e)}")
+        logger.error("API error in fetch_health_profile: %s", e)
         # Provide fallback data in case API fails
-        return "# Error\n\nUnable to retrieve health profile data. Please check your API key and connection."
+        return PROFILE_FALLBACK
 
 
 # Prompts
-@mcp.prompt()
-def analyze_health_summary() -> str:
-    """
-    Create a prompt to analyze health summaries.
-    """
-    logger.info("Prompt Requested: analyze_health_summary")
-    return """
+ANALYZE_HEALTH_SUMMARY_PROMPT = """
     Please analyze the following health summary data and provide insights:
     
     1. Identify any metrics that are outside of normal ranges
@@ -284,8 +663,23 @@ def analyze_health_summary() -> str:
     For available metrics information, check senechal://health/availablemetrics
     """
 
+@mcp.prompt()
+def analyze_health_summary() -> str:
+    """
+    Create a prompt to analyze health summaries.
+    """
+    logger.debug("Prompt Requested: analyze_health_summary")
+    return ANALYZE_HEALTH_SUMMARY_PROMPT
+
 
 # Run the server
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
     logger.info("Starting MCP server")
     mcp.run()
\ No newline at end of file
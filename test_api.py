@@ -4,7 +4,7 @@ Test script to compare direct API responses with MCP responses.
 """
 import asyncio
 import httpx
-import json
+import orjson
 import os
 from dotenv import load_dotenv
 
@@ -22,15 +22,33 @@ if not API_KEY:
 
 async def test_direct_api():
     """Test direct API calls to validate endpoints."""
-    headers = {"X-API-Key": API_KEY}
-    
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(base_url=API_BASE_URL, headers={"X-API-Key": API_KEY}, http2=True) as client:
+        # The endpoints are independent, so request them concurrently
+        # Keep at most four requests in flight
+        semaphore = asyncio.Semaphore(4)
+        
+        async def get(path, params=None):
+            async with semaphore:
+                return await client.get(path, params=params)
+        
+        (profile_response, summary_response, current_response,
+         trends_response, stats_response) = await asyncio.gather(
+            get("/health/profile"),
+            get("/health/summary/day", params={"span": 2, "metrics": "all"}),
+            get("/health/current"),
+            get("/health/trends", params={"days": 7, "interval": "day"}),
+            get("/health/stats", params={"days": 30}),
+            return_exceptions=True
+        )
+        
         # Test health profile endpoint
         print("Testing /health/profile endpoint...")
-        response = await client.get(f"{API_BASE_URL}/health/profile", headers=headers)
-        if response.status_code == 200:
+        response = profile_response
+        if isinstance(response, Exception):
+            print(f"  Request failed: {response}")
+        elif response.status_code == 200:
             print("  Status: OK")
-            profile_data = response.json()
+            profile_data = orjson.loads(response.content)
             print(f"  Data type: {type(profile_data)}")
             print(f"  Keys: {list(profile_data.keys())}")
             print(f"  Demographics: {profile_data.get('demographics', {})}")
@@ -40,14 +58,12 @@ async def test_direct_api():
         
         # Test health summary endpoint
         print("\nTesting /health/summary/day endpoint...")
-        response = await client.get(
-            f"{API_BASE_URL}/health/summary/day", 
-            headers=headers,
-            params={"span": 2, "metrics": "all"}
-        )
-        if response.status_code == 200:
+        response = summary_response
+        if isinstance(response, Exception):
+            print(f"  Request failed: {response}")
+        elif response.status_code == 200:
             print("  Status: OK")
-            summary_data = response.json()
+            summary_data = orjson.loads(response.content)
             print(f"  Data type: {type(summary_data)}")
             print(f"  Keys: {list(summary_data.keys())}")
             if "summaries" in summary_data:
@@ -58,10 +74,12 @@ async def test_direct_api():
         
         # Test current health endpoint
         print("\nTesting /health/current endpoint...")
-        response = await client.get(f"{API_BASE_URL}/health/current", headers=headers)
-        if response.status_code == 200:
+        response = current_response
+        if isinstance(response, Exception):
+            print(f"  Request failed: {response}")
+        elif response.status_code == 200:
             print("  Status: OK")
-            current_data = response.json()
+            current_data = orjson.loads(response.content)
             print(f"  Data type: {type(current_data)}")
             print(f"  Keys: {list(current_data.keys())}")
             if "measurements" in current_data:
@@ -72,14 +90,12 @@ async def test_direct_api():
         
         # Test trends endpoint
         print("\nTesting /health/trends endpoint...")
-        response = await client.get(
-            f"{API_BASE_URL}/health/trends", 
-            headers=headers,
-            params={"days": 7, "interval": "day"}
-        )
-        if response.status_code == 200:
+        response = trends_response
+        if isinstance(response, Exception):
+            print(f"  Request failed: {response}")
+        elif response.status_code == 200:
             print("  Status: OK")
-            trends_data = response.json()
+            trends_data = orjson.loads(response.content)
             print(f"  Data type: {type(trends_data)}")
             print(f"  Keys: {list(trends_data.keys())}")
             if "trends" in trends_data:
@@ -90,14 +106,12 @@ async def test_direct_api():
         
         # Test stats endpoint
         print("\nTesting /health/stats endpoint...")
-        response = await client.get(
-            f"{API_BASE_URL}/health/stats", 
-            headers=headers,
-            params={"days": 30}
-        )
-        if response.status_code == 200:
+        response = stats_response
+        if isinstance(response, Exception):
+            print(f"  Request failed: {response}")
+        elif response.status_code == 200:
             print("  Status: OK")
-            stats_data = response.json()
+            stats_data = orjson.loads(response.content)
             print(f"  Data type: {type(stats_data)}")
             print(f"  Keys: {list(stats_data.keys())}")
             if "stats" in stats_data:
@@ -3,7 +3,7 @@
 Test script to compare MCP responses with direct API responses.
 """
 import asyncio
-import json
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
@@ -24,19 +24,41 @@ async def test_mcp_api():
             print("Initializing connection to Senechal MCP server...")
             await session.initialize()
             
+            # The tool calls are independent, so issue them concurrently
+            # Keep at most four tool calls in flight
+            semaphore = asyncio.Semaphore(4)
+            
+            async def call(name, arguments):
+                async with semaphore:
+                    return await session.call_tool(name, arguments=arguments)
+            
+            calls = {
+                "profile": call("fetch_health_profile", {}),
+                "summary": call(
+                    "fetch_health_summary",
+                    {"period": "day", "metrics": "all", "span": 2, "offset": 0}
+                ),
+                "current": call("fetch_current_health", {}),
+                "trends": call("fetch_health_trends", {"days": 7, "interval": "day"}),
+                "stats": call("fetch_health_stats", {"days": 30}),
+            }
+            results = dict(zip(calls, await asyncio.gather(*calls.values(), return_exceptions=True)))
+            
             # Test health profile tool
             print("\nTesting fetch_health_profile tool...")
             try:
-                result = await session.call_tool("fetch_health_profile", arguments={})
+                result = results["profile"]
+                if isinstance(result, Exception):
+                    raise result
                 if hasattr(result, 'content') and result.content:
                     for content_item in result.content:
                         if hasattr(content_item, 'text'):
                             try:
-                                data = json.loads(content_item.text)
+                                data = orjson.loads(content_item.text)
                                 print(f"  Data type: {type(data)}")
                                 print(f"  Keys: {list(data.keys())}")
                                 print(f"  Demographics: {data.get('demographics', {})}")
-                            except:
+                            except orjson.JSONDecodeError:
                                 print(f"  Error parsing JSON: {content_item.text}")
                 else:
                     print(f"  Result: {result}")
@@ -46,27 +68,21 @@ async def test_mcp_api():
             # Test health summary tool
             print("\nTesting fetch_health_summary tool...")
             try:
-                result = await session.call_tool(
-                    "fetch_health_summary", 
-                    arguments={
-                        "period": "day",
-                        "metrics": "all",
-                        "span": 2,
-                        "offset": 0
-                    }
-                )
+                result = results["summary"]
+                if isinstance(result, Exception):
+                    raise result
                 if hasattr(result, 'content') and result.content:
                     for content_item in result.content:
                         if hasattr(content_item, 'text'):
                             try:
-                                data = json.loads(content_item.text)
+                                data = orjson.loads(content_item.text)
                                 print(f"  Data type: {type(data)}")
                                 print(f"  Keys: {list(data.keys())}")
                                 if "error" in data:
                                     print(f"  Error from API: {data['error']}")
                                 elif "summaries" in data:
                                     print(f"  Number of summaries: {len(data['summaries'])}")
-                            except:
+                            except orjson.JSONDecodeError:
                                 print(f"  Error parsing JSON: {content_item.text}")
                 else:
                     print(f"  Result: {result}")
@@ -76,17 +92,19 @@ async def test_mcp_api():
             # Test current health tool
             print("\nTesting fetch_current_health tool...")
             try:
-                result = await session.call_tool("fetch_current_health", arguments={})
+                result = results["current"]
+                if isinstance(result, Exception):
+                    raise result
                 if hasattr(result, 'content') and result.content:
                     for content_item in result.content:
                         if hasattr(content_item, 'text'):
                             try:
-                                data = json.loads(content_item.text)
+                                data = orjson.loads(content_item.text)
                                 print(f"  Data type: {type(data)}")
                                 print(f"  Keys: {list(data.keys())}")
                                 if "measurements" in data:
                                     print(f"  Number of measurements: {len(data['measurements'])}")
-                            except:
+                            except orjson.JSONDecodeError:
                                 print(f"  Error parsing JSON: {content_item.text}")
                 else:
                     print(f"  Result: {result}")
@@ -96,23 +114,19 @@ async def test_mcp_api():
             # Test trends tool
             print("\nTesting fetch_health_trends tool...")
             try:
-                result = await session.call_tool(
-                    "fetch_health_trends", 
-                    arguments={
-                        "days": 7,
-                        "interval": "day"
-                    }
-                )
+                result = results["trends"]
+                if isinstance(result, Exception):
+                    raise result
                 if hasattr(result, 'content') and result.content:
                     for content_item in result.content:
                         if hasattr(content_item, 'text'):
                             try:
-                                data = json.loads(content_item.text)
+                                data = orjson.loads(content_item.text)
                                 print(f"  Data type: {type(data)}")
                                 print(f"  Keys: {list(data.keys())}")
                                 if "trends" in data:
                                     print(f"  Number of trend categories: {len(data['trends'])}")
-                            except:
+                            except orjson.JSONDecodeError:
                                 print(f"  Error parsing JSON: {content_item.text}")
                 else:
                     print(f"  Result: {result}")
@@ -122,22 +136,19 @@ async def test_mcp_api():
             # Test stats tool
             print("\nTesting fetch_health_stats tool...")
             try:
-                result = await session.call_tool(
-                    "fetch_health_stats", 
-                    arguments={
-                        "days": 30
-                    }
-                )
+                result = results["stats"]
+                if isinstance(result, Exception):
+                    raise result
                 if hasattr(result, 'content') and result.content:
                     for content_item in result.content:
                         if hasattr(content_item, 'text'):
                             try:
-                                data = json.loads(content_item.text)
+                                data = orjson.loads(content_item.text)
                                 print(f"  Data type: {type(data)}")
                                 print(f"  Keys: {list(data.keys())}")
                                 if "stats" in data:
                                     print(f"  Number of stat metrics: {len(data['stats'])}")
-                            except:
+                            except orjson.JSONDecodeError:
                                 print(f"  Error parsing JSON: {content_item.text}")
                 else:
                     print(f"  Result: {result}")
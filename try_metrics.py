@@ -21,16 +21,11 @@ if not API_KEY:
 
 async def test_metrics_endpoint():
     """Test the available metrics endpoint."""
-    headers = {"X-API-Key": API_KEY}
-    
     print(f"\n--- Testing /health/availablemetrics ---")
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_BASE_URL}/health/availablemetrics", 
-                headers=headers
-            )
+        async with httpx.AsyncClient(base_url=API_BASE_URL, headers={"X-API-Key": API_KEY}, http2=True) as client:
+            response = await client.get("/health/availablemetrics")
             
             print(f"Status: {response.status_code}")
             if response.status_code == 200:
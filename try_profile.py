@@ -21,16 +21,11 @@ if not API_KEY:
 
 async def test_profile_endpoint():
     """Test the health profile endpoint."""
-    headers = {"X-API-Key": API_KEY}
-    
     print(f"\n--- Testing /health/profile ---")
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_BASE_URL}/health/profile", 
-                headers=headers
-            )
+        async with httpx.AsyncClient(base_url=API_BASE_URL, headers={"X-API-Key": API_KEY}, http2=True) as client:
+            response = await client.get("/health/profile")
             
             print(f"Status: {response.status_code}")
             if response.status_code == 200:
@@ -3,9 +3,13 @@
 Test script to try the health summary endpoint with different parameters.
 """
 import asyncio
+import hashlib
 import httpx
-import json
+import logging
+import orjson
 import os
+import pathlib
+import time
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -20,79 +24,145 @@ if not API_BASE_URL:
 if not API_KEY:
     raise ValueError("SENECHAL_API_KEY environment variable is required. Please set it in .env file.")
 
+log = logging.getLogger("try_summary")
+
+# Number of bytes of an error body to show (multi-byte text shows fewer characters)
+ERROR_PREVIEW_BYTES = 500
+
+HEADERS = {"X-API-Key": API_KEY}
+
+# Periods to test, and the parameter variants tried for each
+PERIODS = ("day", "week", "month", "year")
+SUMMARY_PATHS = tuple(f"/health/summary/{p}" for p in PERIODS)
+VARIANTS = (
+    ("Default parameters", None),
+    ("With span=1", {"span": 1}),
+    ("With metrics=steps,calories", {"metrics": "steps,calories"}),
+)
+
+# Maximum number of requests in flight at once
+CONCURRENCY = int(os.getenv("SENECHAL_TEST_CONCURRENCY", "4"))
+
+# Optional on-disk cache of successful responses, for repeated development runs
+CACHE_ENABLED = os.getenv("SENECHAL_TEST_CACHE_ENABLE", "").lower() in ("1", "true", "yes", "on")
+CACHE_DIR = pathlib.Path(os.getenv("SENECHAL_TEST_CACHE", ".senechal_cache"))
+CACHE_TTL = 3600
+
+def cache_file(request):
+    """Return the cache file for a request, keyed on its full URL and the API key."""
+    key = hashlib.sha1(f"{API_KEY}\n{request.url}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+async def fetch(client, semaphore, path, label, params=None):
+    """Request one summary variant, returning the response or the exception raised."""
+    request = client.build_request("GET", path, params=params)
+    cached = cache_file(request) if CACHE_ENABLED else None
+    if cached is not None and cached.exists() and time.time() - cached.stat().st_mtime < CACHE_TTL:
+        response = httpx.Response(
+            200,
+            content=cached.read_bytes(),
+            headers={"content-type": "application/json"},
+            request=request,
+            extensions={"from_cache": True}
+        )
+        return path, f"{label} (cached)", response
+    
+    try:
+        async with semaphore:
+            response = await client.send(request)
+    except Exception as e:
+        response = e
+    else:
+        if cached is not None and response.status_code == 200:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cached.write_bytes(response.content)
+    return path, label, response
+
+def report(label, response):
+    """Log the outcome of one summary request as a single record."""
+    lines = [f"\n{label}:"]
+    if isinstance(response, Exception):
+        lines.append(f"Request failed: {str(response)}")
+    else:
+        lines.append(f"Status: {response.status_code}")
+        if not response.extensions.get("from_cache"):
+            lines.append(f"Took: {response.elapsed.total_seconds() * 1000:.1f} ms")
+        content_type = response.headers.get("content-type", "")
+        if response.status_code == 200 and not content_type.startswith("application/json"):
+            lines.append(f"Unexpected content type: {content_type or 'none'}")
+        elif response.status_code == 200:
+            try:
+                data = orjson.loads(response.content)
+                lines.append(f"Success - got {type(data)} with keys: {list(data.keys())}")
+                if "summaries" in data:
+                    lines.append(f"Number of summaries: {len(data['summaries'])}")
+                    if "metrics" in response.request.url.params and len(data["summaries"]) > 0:
+                        lines.append(f"Metrics in first summary: {list(data['summaries'][0]['metrics'].keys())}")
+            except Exception as e:
+                lines.append(f"Request failed: could not parse response: {str(e)}")
+        else:
+            # Error bodies may be large HTML pages; only show the start
+            preview = response.content[:ERROR_PREVIEW_BYTES].decode(response.encoding or "utf-8", errors="replace")
+            lines.append(f"Error: {preview}")
+    log.info("\n".join(lines))
+
 async def test_summary_endpoint():
     """Test the health summary endpoint with various parameters."""
-    headers = {"X-API-Key": API_KEY}
-    
-    # Try with different period values
-    periods = ["day", "week", "month", "year"]
-    
-    for period in periods:
-        print(f"\n--- Testing /health/summary/{period} ---")
-        
-        # Try with default parameters
-        print(f"\nDefault parameters:")
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{API_BASE_URL}/health/summary/{period}", 
-                    headers=headers
-                )
-                
-                print(f"Status: {response.status_code}")
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"Success - got {type(data)} with keys: {list(data.keys())}")
-                    if "summaries" in data:
-                        print(f"Number of summaries: {len(data['summaries'])}")
-                else:
-                    print(f"Error: {response.text}")
-        except Exception as e:
-            print(f"Request failed: {str(e)}")
-        
-        # Try with span=1
-        print(f"\nWith span=1:")
+    # Share one client (and its connection pool) across every request
+    async with httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        headers=HEADERS,
+        # Size the pool to match the semaphore so no connection is opened only to be dropped,
+        # and keep idle connections (and so their DNS lookup) around for the whole run
+        limits=httpx.Limits(
+            max_keepalive_connections=CONCURRENCY,
+            max_connections=CONCURRENCY,
+            keepalive_expiry=30.0
+        ),
+        http2=True,
+        timeout=10.0
+    ) as client:
+        # Warm up the connection (DNS, TCP, TLS, HTTP/2 negotiation) so the timed
+        # requests measure steady-state behaviour
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{API_BASE_URL}/health/summary/{period}", 
-                    headers=headers,
-                    params={"span": 1}
-                )
-                
-                print(f"Status: {response.status_code}")
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"Success - got {type(data)} with keys: {list(data.keys())}")
-                    if "summaries" in data:
-                        print(f"Number of summaries: {len(data['summaries'])}")
-                else:
-                    print(f"Error: {response.text}")
+            await client.get(SUMMARY_PATHS[0])
         except Exception as e:
-            print(f"Request failed: {str(e)}")
+            log.info("Warm-up request failed: %s", e)
         
-        # Try with metrics=steps,calories
-        print(f"\nWith metrics=steps,calories:")
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{API_BASE_URL}/health/summary/{period}", 
-                    headers=headers,
-                    params={"metrics": "steps,calories"}
-                )
-                
-                print(f"Status: {response.status_code}")
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"Success - got {type(data)} with keys: {list(data.keys())}")
-                    if "summaries" in data:
-                        print(f"Number of summaries: {len(data['summaries'])}")
-                        if len(data["summaries"]) > 0:
-                            print(f"Metrics in first summary: {list(data['summaries'][0]['metrics'].keys())}")
-                else:
-                    print(f"Error: {response.text}")
-        except Exception as e:
-            print(f"Request failed: {str(e)}")
+        # The requests are independent, so send them concurrently
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        tasks = [
+            fetch(client, semaphore, path, label, params)
+            for path in SUMMARY_PATHS
+            for label, params in VARIANTS
+        ]
+        started = time.perf_counter()
+        results = await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+    
+    # Show which protocol the server negotiated; with HTTP/2 all requests share one connection
+    for _, _, response in results:
+        if not isinstance(response, Exception) and not response.extensions.get("from_cache"):
+            log.info("HTTP version: %s", response.http_version)
+            break
+    
+    current_path = None
+    for path, label, response in results:
+        if path != current_path:
+            current_path = path
+            log.info("\n--- Testing %s ---", path)
+        report(label, response)
+    
+    log.info("\nCompleted %d requests in %.2fs (concurrency %d)", len(results), elapsed, CONCURRENCY)
 
 if __name__ == "__main__":
+    # Only this script's report is shown; library loggers such as httpx stay at WARNING
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    log.setLevel(logging.INFO)
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(test_summary_endpoint())
\ No newline at end of file